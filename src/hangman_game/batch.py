@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+=========================================================================================================
+Project: Hangman (Python CLI Game)
+File: batch.py
+Author: Mobin Yousefi (GitHub: https://github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=========================================================================================================
+
+Description:
+Batched Hangman simulation for self-play, fuzzing and word-difficulty statistics.
+Many independent games are stored as parallel arrays (secret masks, guessed masks, mistakes)
+and advanced one guess at a time by a single `step` call.
+
+Usage:
+from hangman_game.batch import encode_letters, new_batch, step
+secrets, guessed, mistakes = new_batch(["python", "matrix"])
+step(secrets, guessed, mistakes, encode_letters("pm"), 6)
+
+Notes:
+- Optional dependency: with `numba` installed (`pip install .[batch]`) the kernel is JIT-compiled
+  and parallelised over games; otherwise it runs as plain Python on `array.array` buffers.
+- Secrets and guesses must be lowercase a–z (bit i = chr(ord('a') + i)), as in `GameState`.
+- Like `HangmanEngine.guess`, finished games (won, or `max_mistakes` reached) are left untouched.
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+
+from .main import _letter_bit, _letter_mask
+
+try:
+    import numba
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    numba = None
+    np = None
+
+HAVE_NUMBA = numba is not None
+prange = numba.prange if HAVE_NUMBA else range
+
+
+def _step(secret_masks, guessed_masks, mistakes, letter_bits, max_mistakes) -> None:
+    """Apply one guess per game, in place (repeats and finished games are ignored)."""
+    for i in prange(len(secret_masks)):
+        secret = secret_masks[i]
+        guessed = guessed_masks[i]
+        if mistakes[i] >= max_mistakes or (guessed & secret) == secret:
+            continue
+        bit = letter_bits[i]
+        if guessed & bit:
+            continue
+        guessed_masks[i] = guessed | bit
+        if not (secret & bit):
+            mistakes[i] += 1
+
+
+if HAVE_NUMBA:
+    step = numba.njit(parallel=True, cache=True)(_step)
+else:
+    step = _step
+
+
+def _uint32(values: Iterable[int]):
+    values = list(values)
+    return np.array(values, dtype=np.uint32) if HAVE_NUMBA else array("I", values)
+
+
+def encode_secrets(secrets: Iterable[str]):
+    """Letter masks for each secret word."""
+    return _uint32(_letter_mask(w) for w in secrets)
+
+
+def encode_letters(letters: Iterable[str]):
+    """Letter bits for one guess per game."""
+    return _uint32(_letter_bit(ch) for ch in letters)
+
+
+def new_batch(secrets: Iterable[str]):
+    """Fresh (secret_masks, guessed_masks, mistakes) arrays for a batch of games."""
+    secret_masks = encode_secrets(secrets)
+    n = len(secret_masks)
+    if HAVE_NUMBA:
+        return secret_masks, np.zeros(n, dtype=np.uint32), np.zeros(n, dtype=np.int32)
+    return secret_masks, array("I", [0]) * n, array("i", [0]) * n
+
+
+if HAVE_NUMBA:
+    # Compile once at import so timings of the first real batch exclude JIT time.
+    step(*new_batch(["a"]), encode_letters("a"), 1)
@@ -31,10 +31,11 @@ Notes:
 from __future__ import annotations
 
 import argparse
+import bisect
 import random
 import sys
 import time
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field, replace
 from typing import Iterable, Set
 
 
@@ -61,6 +62,8 @@ _DEFAULT_WORDS = (
     "bytecode",
     "protocol",
 )
+# Already lowercase, alphabetic and unique; lets HangmanEngine skip validation for the default list.
+_DEFAULT_WORDS_CLEAN = tuple(map(sys.intern, _DEFAULT_WORDS))
 
 # ASCII frames for fun — indexed by number of mistakes
 _HANGMAN_FRAMES = [
@@ -122,33 +125,109 @@ _HANGMAN_FRAMES = [
     =========""",
 ]
 
+# One turn of the CLI board, written with a single stdout write.
+_RENDER_TEMPLATE = "{frame}\n\nWord: {masked}\n{wrong}Attempts left: {left}\n"
 
-@dataclass
+
+# `slots=` needs Python 3.10+; older interpreters fall back to a regular (frozen) dataclass.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+if sys.version_info >= (3, 10):
+    _popcount = int.bit_count
+else:  # pragma: no cover - Python 3.9
+
+    def _popcount(n: int) -> int:
+        return bin(n).count("1")
+
+
+def _letter_bit(ch: str) -> int:
+    """Bit for a single lowercase letter (bit 0 = 'a')."""
+    return 1 << (ord(ch) - 97)
+
+
+def _letter_mask(word: str) -> int:
+    mask = 0
+    for ch in word:
+        mask |= _letter_bit(ch)
+    return mask
+
+
+def _is_letter(raw: str) -> bool:
+    """True for exactly one ASCII letter (either case); checked before lowercasing."""
+    return len(raw) == 1 and ("a" <= raw <= "z" or "A" <= raw <= "Z")
+
+
+def _mask_letters(mask: int) -> set[str]:
+    return {chr(97 + i) for i in range(mask.bit_length()) if mask >> i & 1}
+
+
+def _mask_string(mask: int) -> str:
+    """Letters in `mask`, in alphabetical order, as a single string."""
+    return "".join(chr(97 + i) for i in range(mask.bit_length()) if mask >> i & 1)
+
+
+@dataclass(frozen=True, **_SLOTS)
 class GameState:
-    """Immutable-ish snapshot of the game state suitable for rendering & testing."""
+    """Immutable snapshot of the game state suitable for rendering & testing.
+
+    Guessed letters are kept as a bitmask (bit i = chr(ord('a') + i)); use
+    `guessed_letters` for a set view.
+    """
     secret: str
     max_mistakes: int
-    guessed: Set[str] = field(default_factory=set)
+    guessed: int = 0
     mistakes: int = 0
-    started_at: float = field(default_factory=time.time)
-    ended_at: float | None = None
+    started_at_ns: int = 0  # time.monotonic_ns() at new_game; 0 when time isn't recorded
+    ended_at_ns: int | None = None
+    secret_mask: int = 0
+    secret_bytes: bytes = b""  # ASCII copy of `secret`; iterating it yields ints, not 1-char strs
+    # Render caches derived from `guessed`; not init arguments, so `replace()` and hand-built
+    # states recompute them. The engine hands over its incrementally built values via the
+    # `_wrong_sorted`/`_masked` init-only arguments.
+    wrong_sorted: str = field(init=False, repr=False, compare=False)
+    masked: str = field(init=False, repr=False, compare=False)  # e.g. "b _ n _ n _"
+    _wrong_sorted: InitVar[str | None] = None
+    _masked: InitVar[str | None] = None
+
+    def __post_init__(self, _wrong_sorted: str | None, _masked: str | None) -> None:
+        # Derived fields are normally supplied by the engine; fill them in for hand-built states.
+        if not self.secret_mask:
+            if not (self.secret.isascii() and self.secret.isalpha() and self.secret.islower()):
+                raise ValueError(f"secret must be lowercase a-z letters, got {self.secret!r}")
+            object.__setattr__(self, "secret_mask", _letter_mask(self.secret))
+        if not self.secret_bytes:
+            object.__setattr__(self, "secret_bytes", self.secret.encode("ascii"))
+        if _wrong_sorted is None:
+            _wrong_sorted = _mask_string(self.guessed & ~self.secret_mask)
+        object.__setattr__(self, "wrong_sorted", _wrong_sorted)
+        if _masked is None:
+            guessed = self.guessed
+            _masked = b" ".join(
+                bytes((c,)) if guessed & (1 << (c - 97)) else b"_" for c in self.secret_bytes
+            ).decode("ascii")
+        object.__setattr__(self, "masked", _masked)
 
     @property
-    def masked(self) -> str:
-        """Word with unknown letters as underscores, spaced for readability."""
-        return " ".join(ch if ch in self.guessed else "_" for ch in self.secret)
+    def guessed_letters(self) -> set[str]:
+        return _mask_letters(self.guessed)
 
     @property
     def wrong_letters(self) -> Set[str]:
-        return {g for g in self.guessed if g not in self.secret}
+        return _mask_letters(self.guessed & ~self.secret_mask)
 
     @property
     def remaining(self) -> int:
         return self.max_mistakes - self.mistakes
 
+    @property
+    def unique_remaining(self) -> int:
+        """Number of distinct secret letters not yet guessed."""
+        return _popcount(self.secret_mask & ~self.guessed)
+
     @property
     def won(self) -> bool:
-        return all(ch in self.guessed for ch in self.secret)
+        return (self.guessed & self.secret_mask) == self.secret_mask
 
     @property
     def lost(self) -> bool:
@@ -158,9 +237,12 @@ class GameState:
     def finished(self) -> bool:
         return self.won or self.lost
 
-    def duration(self) -> float | None:
-        end = self.ended_at if self.ended_at is not None else time.time()
-        return end - self.started_at if end else None
+    def duration(self) -> float:
+        """Elapsed seconds, up to now if the game is still running (0.0 if time isn't recorded)."""
+        if not self.started_at_ns:
+            return 0.0
+        end = self.ended_at_ns if self.ended_at_ns is not None else time.monotonic_ns()
+        return (end - self.started_at_ns) / 1e9
 
 
 class HangmanEngine:
@@ -171,57 +253,122 @@ class HangmanEngine:
         words: Iterable[str] = _DEFAULT_WORDS,
         max_mistakes: int = 6,
         rng: random.Random | None = None,
+        record_time: bool = True,
     ) -> None:
-        vocab = [w.strip().lower() for w in words if w and w.strip()]
-        if not vocab:
-            raise ValueError("Word list must not be empty.")
-        self._words = [w for w in vocab if w.isalpha()]
-        if not self._words:
-            raise ValueError("Word list must contain at least one alphabetic word.")
+        if words is _DEFAULT_WORDS or words is _DEFAULT_WORDS_CLEAN:
+            self._words = _DEFAULT_WORDS_CLEAN
+        else:
+            vocab = [w for w in map(str.lower, map(str.strip, filter(None, words))) if w]
+            if not vocab:
+                raise ValueError("Word list must not be empty.")
+            # Unique ASCII words only (order kept for seeded runs); interned so equal secrets
+            # share identity.
+            words_ok = filter(str.isalpha, filter(str.isascii, vocab))
+            self._words = tuple(map(sys.intern, dict.fromkeys(words_ok)))
+            if not self._words:
+                raise ValueError(
+                    "Word list must contain at least one a-z (ASCII letters only) word."
+                )
         self._max_mistakes = max(1, int(max_mistakes))
+        # One frame per possible mistake count, saturating at the last drawing.
+        last = len(_HANGMAN_FRAMES) - 1
+        self._frames = tuple(_HANGMAN_FRAMES[min(i, last)] for i in range(self._max_mistakes + 1))
         self._rng = rng or random.Random()
+        # Headless callers (tests, batch play) can skip the clock entirely.
+        self._record_time = record_time
+        # secret -> (secret_mask, secret_bytes, blank masked word), filled lazily by new_game.
+        self._secret_cache: dict[str, tuple[int, bytes, str]] = {}
 
     def new_game(self) -> GameState:
         secret = self._rng.choice(self._words)
-        return GameState(secret=secret, max_mistakes=self._max_mistakes)
+        info = self._secret_cache.get(secret)
+        if info is None:
+            info = self._secret_cache[secret] = (
+                _letter_mask(secret),
+                secret.encode("ascii"),
+                " ".join("_" * len(secret)),
+            )
+        secret_mask, secret_bytes, masked = info
+        return GameState(
+            secret=secret,
+            max_mistakes=self._max_mistakes,
+            secret_mask=secret_mask,
+            _masked=masked,
+            secret_bytes=secret_bytes,
+            started_at_ns=time.monotonic_ns() if self._record_time else 0,
+        )
 
     def guess(self, state: GameState, raw: str) -> GameState:
-        """Apply a guess and return the next state (doesn't mutate input)."""
+        """Apply a guess and return the next state (doesn't mutate input).
+
+        `raw` should already be stripped (the CLI does this); invalid, repeated and post-game
+        guesses return `state` itself without allocating anything.
+        """
         if state.finished:
             return state
 
-        letter = (raw or "").strip().lower()
-        if not (len(letter) == 1 and letter.isalpha()):
+        if not raw or not _is_letter(raw):
             # Ignore invalid guesses silently; caller can message the user.
             return state
+        letter = raw.lower()
 
-        if letter in state.guessed:
+        code = ord(letter)
+        bit = 1 << (code - 97)
+        if state.guessed & bit:
             return state
 
-        guessed = set(state.guessed)
-        guessed.add(letter)
-
-        mistakes = state.mistakes + (0 if letter in state.secret else 1)
-        ended_at = time.time() if (mistakes >= state.max_mistakes or all(c in guessed for c in state.secret)) else None
+        guessed = state.guessed | bit
+        secret_mask = state.secret_mask
+
+        if secret_mask & bit:
+            mistakes = state.mistakes
+            wrong_sorted = state.wrong_sorted
+            # Reveal just the hit positions (letters sit at even indices of the spaced string).
+            chars = bytearray(state.masked, "ascii")
+            for i, c in enumerate(state.secret_bytes):
+                if c == code:
+                    chars[2 * i] = code
+            masked = chars.decode("ascii")
+        else:
+            mistakes = state.mistakes + 1
+            idx = bisect.bisect(state.wrong_sorted, letter)
+            wrong_sorted = state.wrong_sorted[:idx] + letter + state.wrong_sorted[idx:]
+            masked = state.masked
+        # Only stamp the clock on the guess that ends the game.
+        finished = mistakes >= state.max_mistakes or (guessed & secret_mask) == secret_mask
+        ended_at_ns = (time.monotonic_ns() if self._record_time else 0) if finished else None
 
         return GameState(
             secret=state.secret,
             max_mistakes=state.max_mistakes,
             guessed=guessed,
             mistakes=mistakes,
-            started_at=state.started_at,
-            ended_at=ended_at,
+            started_at_ns=state.started_at_ns,
+            ended_at_ns=ended_at_ns,
+            secret_mask=secret_mask,
+            secret_bytes=state.secret_bytes,
+            _wrong_sorted=wrong_sorted,
+            _masked=masked,
         )
 
 
 def _load_words_from_file(path: str) -> list[str]:
+    # One read + one lower() over the whole buffer; strip/isascii/isalpha run in C via
+    # map/filter, and isascii + isalpha on lowercased text keeps exactly the a-z words.
+    # Split on "\n" only (text mode already normalised line endings), like iterating the file;
+    # str.splitlines() would also break on \v, \f, \x85, \u2028 etc.
     with open(path, "r", encoding="utf-8") as f:
-        words = []
-        for line in f:
-            w = line.strip().lower()
-            if w and w.isalpha():
-                words.append(w)
-        return words
+        data = f.read().lower()
+    return list(filter(str.isalpha, filter(str.isascii, map(str.strip, data.split("\n")))))
+
+
+def _prompt(msg: str) -> str:
+    """`input()` for piped stdin: write the prompt without flushing, read one line."""
+    sys.stdout.write(msg)
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line[:-1] if line.endswith("\n") else line
 
 
 def play(
@@ -237,34 +384,41 @@ def play(
     print("\n=== Hangman — CS Master’s Edition ===")
     print("Guess the secret word. Enter one letter per turn. Ctrl+C to quit.\n")
 
+    # Terminals keep input() (and its readline line editing); piped/batch input skips its
+    # per-call flushing.
+    read_guess = input if sys.stdin.isatty() else _prompt
+
     while not state.finished:
-        frame = _HANGMAN_FRAMES[min(state.mistakes, len(_HANGMAN_FRAMES) - 1)]
-        print(frame)
-        print(f"\nWord: {state.masked}")
-        if state.wrong_letters:
-            print(f"Wrong: {', '.join(sorted(state.wrong_letters))}")
-        print(f"Attempts left: {state.remaining}")
-
-        raw = input("Your guess: ").strip()
+        sys.stdout.write(
+            _RENDER_TEMPLATE.format(
+                frame=engine._frames[state.mistakes],
+                masked=state.masked,
+                wrong=f"Wrong: {', '.join(state.wrong_sorted)}\n" if state.wrong_sorted else "",
+                left=state.remaining,
+            )
+        )
+
+        raw = read_guess("Your guess: ").strip()
         if not raw:
             print("Please enter a letter (a–z).")
             continue
         next_state = engine.guess(state, raw)
         if next_state is state:
             # Either invalid or repeated guess
-            if not (len(raw) == 1 and raw.isalpha()):
+            if not _is_letter(raw):
                 print("Invalid input. Enter a single letter (a–z).")
-            elif raw.lower() in state.guessed:
+            elif raw.lower() in state.guessed_letters:
                 print(f"You already guessed '{raw.lower()}'.")
         state = next_state
         print()
 
     # End-of-game screen
-    state.ended_at = state.ended_at or time.time()
-    frame = _HANGMAN_FRAMES[min(state.mistakes, len(_HANGMAN_FRAMES) - 1)]
+    if state.ended_at_ns is None:
+        state = replace(state, ended_at_ns=time.monotonic_ns())
+    frame = engine._frames[state.mistakes]
     print(frame)
     print(f"\nWord: {' '.join(state.secret)}")
-    elapsed = state.duration() or 0.0
+    elapsed = state.duration()
     if state.won:
         print("\n🎉 Congratulations! You solved it.")
         print(f"Time: {elapsed:.1f}s | Mistakes: {state.mistakes}/{state.max_mistakes}")
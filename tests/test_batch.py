@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+=========================================================================================================
+Project: Hangman (Python CLI Game)
+File: test_batch.py
+Author: Mobin Yousefi (GitHub: https://github.com/mobinyousefi-cs)
+Created: 2026-10-15
+Updated: 2026-10-15
+License: MIT License (see LICENSE file for details)
+=========================================================================================================
+
+Description:
+Pytest unit tests for the batched simulation kernel: per-game hits, misses, repeats and
+finished games must match what HangmanEngine does for the same guesses.
+
+Usage:
+pytest -q
+
+Notes:
+- Exercises whichever kernel `hangman_game.batch` selected: numba's when it is installed,
+  the plain-Python fallback otherwise.
+"""
+
+
+
+from hangman_game.batch import encode_letters, new_batch, step
+from hangman_game.main import HangmanEngine
+
+
+def test_step_matches_engine_past_game_end():
+    max_mistakes = 3
+    words = ["abc", "banana", "fog", "ab"]
+    # "abc"/"banana" are won (banana with a repeat) and "fog"/"ab" lost before the last turn;
+    # every guess after that must leave the game untouched.
+    guesses = ["cbaxyzq", "xbbnaqz", "qwertyu", "xyzwabc"]
+    secrets, guessed, mistakes = new_batch(words)
+    for turn in range(len(guesses[0])):
+        step(secrets, guessed, mistakes, encode_letters(g[turn] for g in guesses), max_mistakes)
+
+    for i, (word, letters) in enumerate(zip(words, guesses)):
+        engine = HangmanEngine(words=[word], max_mistakes=max_mistakes, record_time=False)
+        state = engine.new_game()
+        for g in letters:
+            state = engine.guess(state, g)
+        assert state.finished
+        assert guessed[i] == state.guessed
+        assert mistakes[i] == state.mistakes
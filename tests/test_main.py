@@ -12,23 +12,30 @@ License: MIT License (see LICENSE file for details)
 
 Description:
 Pytest unit tests covering core Hangman engine behavior:
-win path, mistake counting, repeat/invalid guess handling, and masked rendering.
+win path, mistake counting, repeat/invalid guess handling, masked rendering,
+word-list loading, and the piped-input prompt.
 
 Usage:
 pytest -q
 
 Notes:
-- Tests import and exercise HangmanEngine only (no I/O).
+- Engine tests do no I/O; the word-list loader test reads a file under pytest's tmp_path and
+  the prompt test swaps sys.stdin/sys.stdout for io.StringIO.
 - Keep tests deterministic by controlling the word list and max mistakes.
 """
 
 
 
-from hangman_game.main import HangmanEngine
+import io
+from dataclasses import replace
+
+import pytest
+
+from hangman_game.main import GameState, HangmanEngine, _load_words_from_file, _prompt
 
 
 def test_engine_win_path():
-    engine = HangmanEngine(words=["abc"], max_mistakes=6)
+    engine = HangmanEngine(words=["abc"], max_mistakes=6, record_time=False)
     state = engine.new_game()
     # guess a, then b, then c
     for g in "abc":
@@ -37,16 +44,17 @@ def test_engine_win_path():
     assert state.finished is True
     assert state.lost is False
     assert state.mistakes == 0
+    assert state.duration() == 0.0
 
 
 def test_engine_counts_mistakes_and_repeats_are_ignored():
-    engine = HangmanEngine(words=["abc"], max_mistakes=2)
+    engine = HangmanEngine(words=["abc"], max_mistakes=2, record_time=False)
     s = engine.new_game()
 
     # wrong guess
     s = engine.guess(s, "x")
     assert s.mistakes == 1
-    assert "x" in s.guessed
+    assert "x" in s.guessed_letters
 
     # repeat wrong guess (ignored)
     s2 = engine.guess(s, "x")
@@ -56,6 +64,9 @@ def test_engine_counts_mistakes_and_repeats_are_ignored():
     # invalid input ignored
     s3 = engine.guess(s, "xy")
     assert s3 is s
+    assert engine.guess(s, "é") is s
+    assert engine.guess(s, "İ") is s  # lowercases to two characters
+    assert engine.guess(s, "A").guessed_letters == {"a", "x"}
 
     # wrong guess to lose
     s = engine.guess(s, "y")
@@ -64,9 +75,69 @@ def test_engine_counts_mistakes_and_repeats_are_ignored():
 
 
 def test_masked_representation_and_wrong_letters():
-    engine = HangmanEngine(words=["banana"], max_mistakes=6)
+    engine = HangmanEngine(words=["banana"], max_mistakes=6, record_time=False)
     s = engine.new_game()
     s = engine.guess(s, "b")
     s = engine.guess(s, "x")
     assert s.masked.replace(" ", "") == "b_____"
     assert s.wrong_letters == {"x"}
+    assert s.wrong_sorted == "x"
+    assert s.unique_remaining == 2  # a, n
+    # the cached render strings follow `guessed` through dataclasses.replace
+    assert replace(s, guessed=s.guessed | 1 << 25).wrong_sorted == "xz"
+    assert replace(s, guessed=0b1).masked == "_ a _ a _ a"
+
+    # out-of-order misses are kept alphabetised
+    for g in "zqy":
+        s = engine.guess(s, g)
+    assert s.wrong_sorted == "qxyz"
+
+
+def test_masked_reveals_every_occurrence():
+    engine = HangmanEngine(words=["banana"], max_mistakes=6, record_time=False)
+    s = engine.new_game()
+    s = engine.guess(s, "a")
+    assert s.masked == "_ a _ a _ a"
+    s = engine.guess(s, "n")
+    assert s.masked == "_ a n a n a"
+    s = engine.guess(s, "b")
+    assert s.masked == "b a n a n a"
+    assert s.won is True
+
+
+def test_game_state_rejects_non_letter_secrets():
+    for secret in ("Abc", "a-b", "café"):
+        with pytest.raises(ValueError, match="a-z"):
+            GameState(secret=secret, max_mistakes=6)
+    assert GameState(secret="abc", max_mistakes=6).masked == "_ _ _"
+    with pytest.raises(ValueError, match="a-z"):
+        HangmanEngine(words=["café"])
+
+
+def test_load_words_from_file(tmp_path):
+    path = tmp_path / "words.txt"
+    path.write_bytes(b"Python\r\n\n  Matrix  \nfog2\nsnake_case\n\ncafe\xcc\x81\nab\x0ccd\nLast")
+    # "ab\fcd" stays one (rejected) line: only "\n" separates words, as with line iteration.
+    assert _load_words_from_file(str(path)) == ["python", "matrix", "last"]
+
+
+def test_prompt_reads_lines_like_input(monkeypatch):
+    out = io.StringIO()
+    monkeypatch.setattr("sys.stdout", out)
+    monkeypatch.setattr("sys.stdin", io.StringIO("a\nlast"))
+    assert _prompt("Your guess: ") == "a"
+    assert _prompt("Your guess: ") == "last"  # no trailing newline
+    with pytest.raises(EOFError):
+        _prompt("Your guess: ")
+    assert out.getvalue() == "Your guess: " * 3
+
+
+def test_frames_padded_to_max_mistakes():
+    engine = HangmanEngine(max_mistakes=9)
+    assert len(engine._frames) == 10
+    assert engine._frames[6:] == (engine._frames[6],) * 4
+
+
+def test_vocabulary_is_normalised_and_deduplicated():
+    assert HangmanEngine(words=[" Py ", "py", "PY"])._words == ("py",)
+    assert HangmanEngine(words=["b", "a", "B"])._words == ("b", "a")